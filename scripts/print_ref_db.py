@@ -0,0 +1,8 @@
+#!/usr/bin/env python
+
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+from transporters.refcache import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+
+from glob import glob
+from setuptools import setup
+
+setup(
+    name="transporters",
+    description="Analysis of transporters in genomes and metaomic datasets",
+    url="https://github.com/johnne/transporters",
+    license="MIT",
+    packages=["transporters"],
+    scripts=sorted(glob("scripts/*.py")),
+    install_requires=["pandas", "networkx"],
+)
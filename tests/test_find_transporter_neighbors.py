@@ -0,0 +1,24 @@
+"""Tests for counting neighbors of transporters on contigs."""
+
+import pandas as pd
+from transporters import find_transporter_neighbors as ftn
+
+def tables():
+    bed = pd.DataFrame({"Start": [0, 100, 200, 300, 0], "End": [90, 190, 290, 390, 90],
+            "ORF": ["o1", "o2", "o3", "o4", "o5"]}, index=pd.Index(["c1", "c1", "c1", "c1", "c2"], name="Contig"))
+    orf2trans = pd.DataFrame({1: ["T1"]}, index=["o2"])
+    orfann = pd.DataFrame({"Family": ["PF00001", "COG0001", "PF00005", "PF00001", "TIGR00001", "PF00002"]},
+            index=pd.Index(["o1", "o1", "o2", "o3", "o4", "o5"], name="ORF"))
+    return bed, orf2trans, orfann
+
+def check(bed, orf2trans, orfann):
+    bed_f = ftn.Filter(bed, orf2trans)
+    df = ftn.find_neighbors(bed_f, orf2trans, orfann, distance=1)
+    assert df.loc["T1"].to_dict() == {"PF00001": 2, "COG0001": 1}
+
+def test_plain_tables():
+    check(*tables())
+
+def test_categorical_tables():
+    bed, orf2trans, orfann = tables()
+    check(bed.astype({"ORF": "category"}), orf2trans.astype("category"), orfann.astype("category"))
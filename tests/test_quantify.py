@@ -0,0 +1,29 @@
+"""Tests for quantifying transporters from ORF annotations and coverage."""
+
+import pandas as pd
+from transporters import quantify
+
+def tables(cov):
+    cdef = pd.DataFrame({"transporter": ["T1", "T1", "T2"], "family": ["PF00001", "COG0001", "TIGR00001"]})
+    ann = pd.DataFrame({"orf": ["orf1", "orf2", "orf3", "orf3"], "family": ["PF00001", "COG0001", "TIGR00001", "PF00001"]})
+    return cdef, ann, cov
+
+def test_quantify():
+    cov = pd.DataFrame({"s1": [1., 2., 4.], "s2": [0., 1., 3.]}, index=["orf1", "orf2", "orf3"])
+    tmean, dfsum, tcov = quantify.quantify(*tables(cov))
+    assert dfsum.loc["PF00001"].tolist() == [5., 3.]
+    assert tmean.loc["T1"].tolist() == [3.5, 2.]
+    assert tmean.loc["T2"].tolist() == [4., 3.]
+
+def test_integer_coverage():
+    cov = pd.DataFrame({"s1": [1, 2, 4], "s2": [0, 1, 3]}, index=["orf1", "orf2", "orf3"])
+    tmean, dfsum, tcov = quantify.quantify(*tables(cov))
+    assert list(dfsum.columns) == ["s1", "s2"]
+    assert dfsum.loc["PF00001"].tolist() == [5, 3]
+    assert tmean.loc["T1"].tolist() == [3.5, 2.]
+
+def test_duplicate_orfs():
+    cov = pd.DataFrame({"s1": [1., 2., 4., 10.], "s2": [0., 1., 3., 10.]}, index=["orf1", "orf2", "orf3", "orf1"])
+    tmean, dfsum, tcov = quantify.quantify(*tables(cov))
+    assert dfsum.loc["PF00001"].tolist() == [15., 13.]
+    assert dfsum.loc["COG0001"].tolist() == [2., 1.]
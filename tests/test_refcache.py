@@ -0,0 +1,103 @@
+"""Tests for the reference cache, with a local directory served through file://
+urls standing in for the remote server."""
+
+import gzip, logging, os, sys
+import pytest
+from transporters import refcache
+
+COG = "# COG\tfunc\tname\nCOG0001\tH\tGlutamate-1-semialdehyde aminotransferase\nCOG0002\tE\tN-acetyl-gamma-glutamylphosphate reductase\n"
+TIGRFAM = "HMMER3/f\nNAME  TIGR00001\nACC   TIGR00001\nDESC  ribosomal protein bL35\n\nLENG  63\n//\nNAME  TIGR00002\nACC   TIGR00002.1\nDESC  ribosomal protein S16\n//\n"
+
+@pytest.fixture
+def remote(tmp_path):
+    d = tmp_path / "remote"
+    d.mkdir()
+    (d / "cognames2003-2014.tab").write_text(COG)
+    with gzip.open(str(d / "TIGRFAMs_15.0_HMM.LIB.gz"), 'wt') as fh: fh.write(TIGRFAM)
+    return d
+
+@pytest.fixture
+def cache(tmp_path):
+    return str(tmp_path / "cache")
+
+@pytest.fixture
+def parses(monkeypatch):
+    '''Counts how often each database is parsed'''
+    n = {}
+    for db, d in refcache.DATABASES.items():
+        def parser(hin, db=db, parse=d["parser"]):
+            n[db] = n.get(db, 0)+1
+            return parse(hin)
+        monkeypatch.setitem(refcache.DATABASES, db, dict(d, parser=parser))
+    return n
+
+@pytest.fixture
+def downloads(caplog):
+    caplog.set_level(logging.INFO)
+    return lambda: sum(r.getMessage().startswith("Downloading") for r in caplog.records)
+
+def url(remote, f="cognames2003-2014.tab"):
+    return (remote / f).as_uri()
+
+def test_download_and_parse(remote, cache, parses, downloads):
+    table = refcache.fetch("cog", cache, url=url(remote))
+    assert table == {"COG0001": "Glutamate-1-semialdehyde aminotransferase",
+                     "COG0002": "N-acetyl-gamma-glutamylphosphate reductase"}
+    assert downloads() == 1 and parses == {"cog": 1}
+    assert os.path.exists(os.path.join(cache, "cog.pkl"))
+
+def test_reuse_pickle(remote, cache, parses, downloads):
+    table = refcache.fetch("cog", cache, url=url(remote))
+    assert refcache.fetch("cog", cache, url=url(remote)) == table
+    assert downloads() == 1 and parses == {"cog": 1}
+
+def test_touched_source_reuses_pickle(remote, cache, parses):
+    table = refcache.fetch("cog", cache, url=url(remote))
+    src = os.path.join(cache, "cognames2003-2014.tab")
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns+10**9))
+    assert refcache.fetch("cog", cache, url=url(remote)) == table
+    assert parses == {"cog": 1}
+
+def test_changed_source_is_parsed(remote, cache, parses):
+    refcache.fetch("cog", cache, url=url(remote))
+    with open(os.path.join(cache, "cognames2003-2014.tab"), 'a') as fh: fh.write("COG0003\tP\tArsenite pump\n")
+    assert refcache.fetch("cog", cache, url=url(remote))["COG0003"] == "Arsenite pump"
+    assert parses == {"cog": 2}
+
+def test_refresh_unchanged_remote(remote, cache, parses, downloads):
+    table = refcache.fetch("cog", cache, url=url(remote))
+    assert refcache.fetch("cog", cache, url=url(remote), refresh=True) == table
+    assert downloads() == 1 and parses == {"cog": 1}
+
+def test_refresh_changed_remote(remote, cache, parses, downloads):
+    refcache.fetch("cog", cache, url=url(remote))
+    (remote / "cognames2003-2014.tab").write_text(COG+"COG0003\tP\tArsenite pump\n")
+    assert "COG0003" in refcache.fetch("cog", cache, url=url(remote), refresh=True)
+    assert downloads() == 2 and parses == {"cog": 2}
+
+def test_refresh_without_last_modified(remote, cache, parses, downloads, monkeypatch):
+    '''ftp servers only report the size, the download is compared by checksum'''
+    urlopen = refcache.request.urlopen
+    def ftp_like(req):
+        r = urlopen(req)
+        del r.headers["Last-Modified"]
+        return r
+    monkeypatch.setattr(refcache.request, "urlopen", ftp_like)
+    table = refcache.fetch("cog", cache, url=url(remote))
+    assert refcache.fetch("cog", cache, url=url(remote), refresh=True) == table
+    assert downloads() == 2 and parses == {"cog": 1}
+
+def test_other_url_is_downloaded(remote, cache, parses, downloads):
+    refcache.fetch("cog", cache, url=url(remote))
+    (remote / "other.tab").write_text("COG0009\tP\tOther release\n")
+    assert refcache.fetch("cog", cache, url=url(remote, "other.tab")) == {"COG0009": "Other release"}
+    assert downloads() == 2 and parses == {"cog": 2}
+
+def test_mirror(remote, cache, parses, downloads, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["print_ref_db.py", "tigrfam", "--mirror", str(remote), "--cache_dir", cache])
+    for i in range(2): refcache.main()
+    out = capsys.readouterr().out
+    assert out == 2*"TIGR00001\tribosomal protein bL35\nTIGR00002\tribosomal protein S16\n"
+    assert downloads() == 0 and parses == {"tigrfam": 1}
+    assert sorted(os.listdir(cache)) == ["tigrfam.json", "tigrfam.pkl"]
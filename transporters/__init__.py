@@ -0,0 +1,7 @@
+"""Analysis of transporters in genomes and metaomic datasets.
+
+Each submodule holds the functions behind one of the command line scripts in
+scripts/ together with its main(). Heavy dependencies (pandas, numpy,
+networkx) are only loaded when first used, so importing the package or
+running --help is fast.
+"""
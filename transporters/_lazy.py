@@ -0,0 +1,19 @@
+"""Deferred imports of heavy dependencies."""
+
+import importlib.util, sys
+
+def lazy_import(name):
+    '''Returns module name, which is only executed on first attribute access'''
+    try: return sys.modules[name]
+    except KeyError: pass
+    spec = importlib.util.find_spec(name)
+    if spec is None: raise ImportError("No module named '"+name+"'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
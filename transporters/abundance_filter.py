@@ -0,0 +1,35 @@
+"""Filter transporters by their relative abundance in samples."""
+
+from argparse import ArgumentParser
+import sys
+from ._lazy import pd
+
+def abundance_filter(tcov, min_abundance=1, sort=False):
+    '''Normalizes transporter (rows) coverage in samples (columns) to percentages
+    and keeps transporters with a maximum of at least min_abundance'''
+    ## Normalize to percentages
+    tcovn = tcov.div(tcov.sum())*100
+
+    tcovn_in = tcovn[tcovn.max(axis=1)>=min_abundance]
+
+    if sort: tcovn_in = tcovn_in.loc[tcovn_in.sum(axis=1).sort_values(ascending=False).index]
+    return tcovn_in
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("-i", "--infile", type=str, required=True,
+            help="Transporter (rows) coverage in samples (columns)")
+    parser.add_argument("-f", "--filter", type=float, default=1,
+            help="Lowest maximum abundance across samples to include transporter")
+    parser.add_argument("-s", "--sort", action="store_true",
+            help="Also sort transporters by sum across all samples")
+
+    args = parser.parse_args()
+
+    tcov = pd.read_csv(args.infile, header=0, sep="\t", index_col=0)
+    tcovn_in = abundance_filter(tcov, args.filter, args.sort)
+
+    tcovn_in.to_csv(sys.stdout, sep="\t")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""Find neighbors to transporters on contigs and report their annotated function."""
+
+import sys, logging
+from argparse import ArgumentParser
+from . import tables
+from ._lazy import pd
+
+def Filter(bed,orf2trans):
+    '''Filters contigs'''
+    ## Remove contigs without transporters
+    contigs = list(set(bed[bed.ORF.isin(orf2trans.index)].index))
+    bed_f = bed.loc[contigs]
+    ## Remove contigs with only 1 ORF
+    bed_f = bed_f.loc[bed_f.groupby(level=0).count().iloc[:,0]>1]
+    return bed_f
+
+def Merge(bed_f, orf2trans, orfann):
+    ## Merge dataframes, first bed with all ORF annotations
+    x = pd.merge(bed_f,orfann,right_index=True,left_on="ORF")
+    ## Next, merge with ORF-> transporter map
+    y = pd.merge(x,orf2trans, left_on="ORF",right_index=True, how="outer")
+    return y
+
+def FindNeighbors(merged,distance,logging,families=None):
+    '''Counts neighbors of each transporter. If families is given the Family
+    column holds arrays of codes into families, decoded for the output'''
+    ## Add index
+    merged["Index"] = range(0,len(merged))
+    merged["Contig"] = merged.index
+    merged.index = merged.Index
+
+    ## Get index for transporter ORFs
+    transporter_index = merged[merged[1]==merged[1]].index
+    
+    t_neighbors = {}
+
+    ## For progress bar
+    part = max(1,len(transporter_index)//10)
+    progress = 0
+
+    for j,index in enumerate(transporter_index, start=1):
+        if j%part == 0: 
+            progress+=10
+            logging.info(str(progress)+"%")
+        contig = merged.loc[index,"Contig"]
+        t = merged.loc[index,1] ## Current transporter
+        try: t_neighbors[t]
+        except KeyError: t_neighbors[t] = {}
+        ## Generate index range
+        r = range(index-distance,index+distance+1)
+        ## Line index range up with matching contigs
+        m = pd.DataFrame(merged["Contig"].reindex(r)==contig)
+        r_m = m[m["Contig"]==True].index ## Matching range
+        ## Iterate the index range
+        for i in r_m:
+            if i==index: continue
+            t_n = merged.loc[i,1] ## Transporter annotation
+            if t_n==t_n: 
+                try: t_neighbors[t][t_n]+=1
+                except KeyError: t_neighbors[t][t_n] = 1
+            a_n = merged.loc[i,"Family"]
+            if type(a_n)==float: continue
+            for item in a_n:
+                try: t_neighbors[t][item]+=1
+                except KeyError: t_neighbors[t][item] = 1
+    ## Create dataframe
+    df = pd.DataFrame(t_neighbors).T
+    if families is not None:
+        ## Transporter names are labels already, family codes are ints (-1 is missing)
+        df.columns = [c if isinstance(c, str) else families[c] if c>=0 else float("nan") for c in df.columns]
+    df.fillna(0,inplace=True)
+    return df
+
+def find_neighbors(bed_f, orf2trans, orfann, distance=3):
+    '''Counts protein families and transporters within distance ORFs of each
+    transporter, on contigs in bed_f (as returned by Filter). Returns a data
+    frame with transporters as rows'''
+
+    ## Aggregate annotations into an array of family codes per ORF
+    logging.info("Aggregating annotations...")
+    families = tables.categories(orfann.Family)
+    fams = pd.Series(tables.intern(orfann.Family, families), index=orfann.index)
+    orfann = fams.cat.codes.groupby(level=0).apply(lambda col: col.values).to_frame("Family")
+    ## Encode ORF ids against a dictionary shared by all tables
+    orfs = tables.categories(bed_f.ORF, orf2trans.index, orfann.index)
+    bed_f = bed_f.assign(ORF=tables.intern(bed_f.ORF, orfs))
+    orf2trans = tables.intern_index(orf2trans.copy(), orfs)
+    tables.intern_index(orfann, orfs)
+
+    ## Merge tables
+    merged = Merge(bed_f, orf2trans, orfann)
+
+    ## Find neighbors
+    logging.info("Finding neighbors...")
+    return FindNeighbors(merged,distance,logging,families)
+
+def main():
+    parser = ArgumentParser('''Finds neighbors to transporters on contigs and reports the annotated function''')
+    parser.add_argument("-b", "--bed", required = True,
+            help="Bed file for assembly. Defines the contigs and predicted ORFs. First 4 columns need to be <Contig> <Start> <End> <ORF id>.")
+    parser.add_argument("-t", "--orf2trans", required=True,
+            help="Table with ORF-> transporter mapping (see --orftable flag in calculate_transporter_abundance.py). \
+                    Format is: <ORF> <transporter> [protein family].")
+#    parser.add_argument("-t", "--transporters", type=str, required=True,
+#            help="Transporter definitions, tab separated. Format: <Transporter> <PFAMs> <TIGRFAMs> <COGs> <Other db>")
+    parser.add_argument("-a", "--annotations", required=True,
+            help="Annotations for ORFs, one annotation per line")
+    parser.add_argument("-d", "--distance", default=3, type=int,
+            help="Distance in ORFs from transporter to analyze. Defaults to 3.")
+    parser.add_argument("-o", "--outfile", type=str,
+            help="Write data frame with protein family/transporter neighboring counts for each transporter")
+    parser.add_argument("-v", "--verbose", action="store_true",
+            help="increase output verbosity")
+
+    args = parser.parse_args()    
+
+    if args.verbose: logging.basicConfig(format='%(levelname)s:%(message)s',level=logging.INFO)
+
+    ## Read ORF->transporter map
+    orf2trans = tables.read_ids(args.orf2trans, None, index_col=0)
+    logging.info("Read "+str(len(orf2trans))+" ORF->transporter mappings")
+
+    ## Read bed file
+    bed = tables.read_bed(args.bed)
+    logging.info("Read "+str(len(bed))+" ORF definitions on "+str(len(set(bed.index)))+" contigs")
+
+    ## Filter bed file
+    logging.info("Filtering to remove contigs without transporters/with too few ORFs")
+    bed_f = Filter(bed,orf2trans)
+    logging.info(str(len(set(bed_f.index)))+" contigs remaining after filtering")
+    if len(bed_f.index)==0: sys.exit()
+
+    ## Read ORF annotations
+    orfann = tables.read_ids(args.annotations, ["ORF","Family"], usecols=[0,1], index_col=0)
+    logging.info("Read annotations for ORFs")
+
+    ## Find neighbors
+    df = find_neighbors(bed_f, orf2trans, orfann, args.distance)
+
+    ## Write
+    if args.outfile: df.to_csv(args.outfile, sep="\t")
+    else: df.to_csv(sys.stdout, sep="\t")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Link protein families that are annotated to the same gene."""
+
+import sys, csv
+from argparse import ArgumentParser
+from ._lazy import pd
+
+def rowsplit(s): return s.rstrip(";").split(";")
+
+def link_families(rows,families=None):
+    '''Creates links between families from rows of [gene,PFAMs,TIGRFAMs,COGs].
+    Families without links are linked to "". If families are given only links
+    between these families are created.'''
+    links = []
+    for row in rows:
+        [gene,pf,tigr,cog] = row
+        pfams = rowsplit(pf)
+        tigrfams = rowsplit(tigr)
+        cogs = rowsplit(cog)
+        store = pfams+tigrfams+cogs
+        if families: store = list(set(store).intersection(set(families)))
+        elif len(store)==1: links.append([store[0],""])
+        for fam in store:
+            for fam2 in store:
+                if fam==fam2: continue
+                links.append([fam,fam2])
+    if families:
+        linked = set(l[0] for l in links)
+        for fam in set(families).difference(linked): links.append([fam,""])
+    return pd.DataFrame(links,columns=['Node1','Node2'])
+
+def tab_to_dataframe(infile,families):
+    with open(infile, 'r') as fh:
+        reader = csv.reader(fh,delimiter="\t")
+        next(reader, None)
+        return link_families(reader,families)
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("-i", "--infile", required=True,
+            help="Infile cross-reference table with columns ['gene_id','PFAMs','TIGRFAMs','COGs']")
+    parser.add_argument("-f", "--families", nargs="*",
+            help="Only create links for these families")
+    parser.add_argument("-o", "--outfile", 
+            help="Write table to outfile. Defaults to stdout")
+
+    args = parser.parse_args()
+    
+    linkdf = tab_to_dataframe(args.infile, args.families)
+    
+    if args.outfile: out = args.outfile
+    else: out = sys.stdout
+    linkdf.to_csv(out,sep="\t")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+"""Print COG ids and names from the NCBI COG names table."""
+
+from . import refcache
+
+def main():
+    refcache.main("cog")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""Print accession and description of each model in an HMM database."""
+import sys
+
+
+def read_hmm(hin):
+    '''Yields (accession, description) for each model in an open HMM file'''
+    hmm = {"ACC": "", "DESC": "", "//": ""}
+    for line in hin:
+        items = line.rsplit()
+        if not items: continue
+        try: hmm[items[0]]
+        except KeyError: continue
+        if items[0]=="//":
+            yield (hmm['ACC'].split(".")[0], hmm['DESC'])
+            hmm = {"ACC": "", "DESC": "", "//": ""}
+        else: hmm[items[0]] = " ".join(items[1:])
+
+
+def main():
+    try:
+        infile = sys.argv[1]
+    except IndexError:
+        sys.exit("Usage: print_hmm_db.py <infile.hmm>")
+
+    if ".gz" in infile:
+        import gzip as gz
+        hin = gz.open(infile, 'rt')
+    else: hin = open(infile, 'r')
+    for acc, desc in read_hmm(hin): print(acc+"\t"+desc)
+    hin.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""Local cache of COG, Pfam and TIGRFAM description tables.
+
+Each database is read from a mirror directory if one is given, otherwise it is
+downloaded once into the cache directory and only fetched again on --refresh
+or when another url is given. Sources are parsed line by line and the parsed
+{accession: description} table is stored as a pickle next to a small json file
+recording the size, modification time and sha256 checksum of the source. The
+pickle is reused for as long as the source is unchanged.
+"""
+
+import gzip, hashlib, json, logging, os, pickle, shutil, sys, tempfile
+from argparse import ArgumentParser
+from urllib import request
+from urllib.error import HTTPError
+from .print_hmm_db import read_hmm
+
+CACHE_VERSION = 1
+
+def read_cog(hin):
+    '''Yields (COG id, name) from the COG names table'''
+    for line in hin:
+        if line[0]=="#": continue
+        items = line.rstrip().split("\t")
+        yield (items[0], items[-1])
+
+def read_pfam_clans(hin):
+    '''Yields (Pfam accession, description) from Pfam-A.clans.tsv'''
+    for line in hin:
+        items = line.rstrip("\n").split("\t")
+        yield (items[0], items[-1])
+
+DATABASES = {
+    "cog": {"file": "cognames2003-2014.tab",
+            "url": "ftp://ftp.ncbi.nih.gov/pub/COG/COG2014/data/cognames2003-2014.tab",
+            "parser": read_cog},
+    "pfam": {"file": "Pfam-A.clans.tsv.gz",
+            "url": "ftp://ftp.ebi.ac.uk/pub/databases/Pfam/current_release/Pfam-A.clans.tsv.gz",
+            "parser": read_pfam_clans},
+    "tigrfam": {"file": "TIGRFAMs_15.0_HMM.LIB.gz",
+            "url": "https://ftp.ncbi.nlm.nih.gov/hmm/TIGRFAMs/release_15.0/TIGRFAMs_15.0_HMM.LIB.gz",
+            "parser": read_hmm},
+}
+
+def default_cache_dir():
+    return os.environ.get("TRANSPORTERS_CACHE",
+            os.path.join(os.path.expanduser("~"), ".cache", "transporters"))
+
+def sha256sum(f):
+    h = hashlib.sha256()
+    with open(f, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1<<20), b""): h.update(chunk)
+    return h.hexdigest()
+
+def read_meta(f):
+    try:
+        with open(f, 'r') as fh: return json.load(fh)
+    except (IOError, ValueError): return {}
+
+def write_atomic(f, dump, mode='w'):
+    '''Writes f with dump(fh) through a unique temporary file in the same
+    directory, so concurrent jobs never publish a partially written file'''
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(f) or ".")
+    try:
+        with os.fdopen(fd, mode) as fh: dump(fh)
+        os.replace(tmp, f)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+def write_meta(meta, f):
+    write_atomic(f, lambda fh: json.dump(meta, fh, indent=1))
+
+def open_source(f):
+    '''Opens a (gzipped) source file for streaming, ignoring undecodable bytes'''
+    if f.endswith(".gz"): return gzip.open(f, 'rt', encoding='utf-8', errors='ignore')
+    return open(f, 'r', encoding='utf-8', errors='ignore')
+
+def download(url, dest, remote=None):
+    '''Downloads url to dest unless the remote file is unchanged since the last
+    download (described by the headers in remote). Returns the new headers'''
+    remote = remote or {}
+    req = request.Request(url)
+    if os.path.exists(dest) and url.startswith("http"):
+        if remote.get("ETag"): req.add_header("If-None-Match", remote["ETag"])
+        if remote.get("Last-Modified"): req.add_header("If-Modified-Since", remote["Last-Modified"])
+    try: r = request.urlopen(req)
+    except HTTPError as e:
+        if e.code==304:
+            logging.info(url+" not modified")
+            return remote
+        raise
+    with r:
+        headers = {k: r.headers.get(k) for k in ("ETag","Last-Modified","Content-Length")}
+        ## Servers without conditional requests (file) may still report Last-Modified
+        if os.path.exists(dest) and headers.get("Last-Modified") and \
+                {k: remote.get(k) for k in headers}==headers:
+            logging.info(url+" not modified")
+            return remote
+        logging.info("Downloading "+url)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest))
+        try:
+            with os.fdopen(fd, 'wb') as fh: shutil.copyfileobj(r, fh)
+            ## ftp only reports the size, so compare the content with the cached copy
+            if os.path.exists(dest) and os.path.getsize(tmp)==os.path.getsize(dest) and \
+                    sha256sum(tmp)==sha256sum(dest):
+                logging.info(url+" not modified")
+                os.remove(tmp)
+                return headers
+            os.replace(tmp, dest)
+        except BaseException:
+            if os.path.exists(tmp): os.remove(tmp)
+            raise
+    return headers
+
+def load(src, parser, cache):
+    '''Returns the {accession: description} table parsed from src, reading the
+    pickled table at cache if src has not changed since it was written'''
+    meta = read_meta(cache+".json")
+    st = os.stat(src)
+    stat = {"source": os.path.abspath(src), "size": st.st_size, "mtime": st.st_mtime_ns}
+    fresh = meta.get("version")==CACHE_VERSION and os.path.exists(cache+".pkl")
+    if fresh and any(meta.get(k)!=v for k,v in stat.items()):
+        ## Touched or replaced, check whether the content changed
+        fresh = meta.get("sha256")==sha256sum(src)
+        if fresh:
+            meta.update(stat)
+            write_meta(meta, cache+".json")
+    if fresh:
+        with open(cache+".pkl", 'rb') as fh: return pickle.load(fh)
+    logging.info("Parsing "+src)
+    with open_source(src) as hin: table = dict(parser(hin))
+    write_atomic(cache+".pkl", lambda fh: pickle.dump(table, fh, protocol=pickle.HIGHEST_PROTOCOL), 'wb')
+    meta.update(stat, version=CACHE_VERSION, sha256=sha256sum(src))
+    write_meta(meta, cache+".json")
+    return table
+
+def fetch(db, cache_dir=None, mirror=None, url=None, refresh=False):
+    '''Returns the {accession: description} table for db ('cog', 'pfam' or
+    'tigrfam'). The source is read from the mirror directory if given,
+    otherwise from url (defaults to the public release) via the cache. The
+    file is downloaded again on refresh or when url differs from the cached one'''
+    d = DATABASES[db]
+    url = url or d["url"]
+    if cache_dir is None: cache_dir = default_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+    cache = os.path.join(cache_dir, db)
+    if mirror: src = os.path.join(mirror, d["file"])
+    else:
+        src = os.path.join(cache_dir, d["file"])
+        meta = read_meta(cache+".json")
+        same_url = meta.get("url")==url
+        if refresh or not same_url or not os.path.exists(src):
+            ## Headers of another url say nothing about this one
+            remote = meta.get("remote", {}) if same_url else {}
+            meta.update(remote=download(url, src, remote), url=url)
+            write_meta(meta, cache+".json")
+    return load(src, d["parser"], cache)
+
+def main(db=None):
+    logging.basicConfig(format='%(asctime)s %(message)s', level=logging.INFO)
+    parser = ArgumentParser()
+    if db is None:
+        parser.add_argument("db", choices=sorted(DATABASES),
+                help="Reference database to print")
+    parser.add_argument("-m", "--mirror", default=os.environ.get("TRANSPORTERS_MIRROR"),
+            help="Local directory with the reference files. Defaults to $TRANSPORTERS_MIRROR, \
+                    if unset files are downloaded")
+    parser.add_argument("-c", "--cache_dir", default=default_cache_dir(),
+            help="Cache directory. Defaults to $TRANSPORTERS_CACHE or ~/.cache/transporters")
+    parser.add_argument("-u", "--url",
+            help="Download the reference file from this url instead")
+    parser.add_argument("--refresh", action="store_true",
+            help="Check for an updated remote file")
+
+    args = parser.parse_args()
+    table = fetch(db or args.db, args.cache_dir, args.mirror, args.url, args.refresh)
+    for acc, desc in table.items(): sys.stdout.write(acc+"\t"+desc+"\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Compact readers for the ORF/contig/family tables shared by the scripts.
+
+Identifiers (ORF ids, contig names, family and transporter accessions) are
+interned as pandas categoricals so that each distinct string is stored once and
+tables are merged/grouped on integer codes. Tables that are combined should be
+encoded against the same dictionary (see categories()), otherwise pandas falls
+back to comparing strings. Abundances are stored as float32. Labels are only
+decoded back to strings when a table is written.
+"""
+
+from ._lazy import np, pd
+
+ABUNDANCE_DTYPE = "float32"
+
+def categories(*values):
+    '''Returns the sorted union of identifiers in values, to use as a shared dictionary'''
+    u = pd.Index([])
+    for v in values:
+        if isinstance(v, (pd.Categorical, pd.CategoricalIndex)): v = v.categories
+        elif hasattr(v, "cat"): v = v.cat.categories
+        else: v = pd.Index(v).dropna().drop_duplicates()
+        ## Categories are unique and usually sorted, which union() merges in linear time
+        u = v if len(u)==0 else u.union(v)
+    if not u.is_monotonic_increasing: u = u.sort_values()
+    return u
+
+def intern(values, cats):
+    '''Encodes values against the dictionary cats'''
+    return pd.Categorical(values, categories=cats)
+
+def intern_index(df, cats, name=None):
+    '''Encodes the index of df against the dictionary cats'''
+    df.index = pd.CategoricalIndex(intern(df.index, cats), name=name or df.index.name)
+    return df
+
+def positions(index, values):
+    '''Returns the row position in the (unique) categorical index of each of the
+    categorical values, encoded against the same dictionary. -1 where missing'''
+    if not index.is_unique: raise ValueError("positions() needs a unique index")
+    ## The extra last slot maps missing values (code -1) to -1
+    pos = np.full(len(index.categories)+1, -1, dtype=np.intp)
+    pos[index.codes] = np.arange(len(index))
+    return pos[np.asarray(values.cat.codes)]
+
+def read_ids(f, names, usecols=None, header=None, index_col=None):
+    '''Reads a tab separated table of identifiers with all columns as categoricals'''
+    return pd.read_csv(f, header=header, sep="\t", names=names, usecols=usecols,
+            index_col=index_col, dtype="category")
+
+def read_bed(f):
+    '''Reads the first 4 columns <Contig> <Start> <End> <ORF id> of a bed file, indexed by contig'''
+    return pd.read_csv(f, sep="\t", header=None, index_col=0, names=["Contig","Start","End","ORF"],
+            usecols=[0,1,2,3], dtype={"Contig": "category", "ORF": "category"})
+
+def read_annotations(f, names=("orf","family")):
+    '''Reads ORF annotations with columns <ORF> <family>'''
+    ann = read_ids(f, list(names), usecols=[0,1])
+    c = ann[names[1]].cat
+    ## Rename on the dictionary, merging categories that become duplicates
+    new, uniq = pd.factorize(c.categories.str.replace("PFAM","PF"))
+    codes = np.where(c.codes>=0, new[c.codes], -1)
+    ann[names[1]] = pd.Categorical.from_codes(codes, uniq)
+    return ann
+
+def read_abundance(f, ids=None):
+    '''Reads ORF (rows) abundance in samples (columns) as float32, with ids as
+    a categorical index. If ids is given the index is encoded against it.'''
+    cols = pd.read_csv(f, header=0, sep="\t", nrows=0).columns
+    dtype = {c: ABUNDANCE_DTYPE for c in cols[1:]}
+    dtype[cols[0]] = "category"
+    df = pd.read_csv(f, header=0, sep="\t", index_col=0, dtype=dtype)
+    if ids is not None: intern_index(df, ids)
+    return df
+
+def group_by(df, key, cats, how="sum", columns=None):
+    '''Aggregates (sum, mean, ...) the numeric abundance columns of df over the
+    categorical column key, grouping on integer codes. Returns a frame indexed
+    by the labels in cats that occur in df.'''
+    if columns is None: columns = [c for c in df.columns if c!=key and df[c].dtype.kind in "iuf"]
+    codes = df[key].cat.codes.values
+    keep = codes>=0
+    g = df.loc[keep, columns].groupby(codes[keep]).agg(how)
+    g.index = pd.CategoricalIndex(pd.Categorical.from_codes(g.index.values, cats), name=key)
+    return g